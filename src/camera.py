@@ -1,11 +1,13 @@
+import functools
 import logging
 import os
 import re
-from typing import Dict, Optional
+import threading
+from typing import Dict, Optional, Tuple
 
 import cv2
-import requests  # type: ignore
-from lxml.html import fromstring
+from lxml import etree
+from lxml.html import HTMLParser, fromstring
 from numpy import std
 from requests.exceptions import RequestException  # type: ignore
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
@@ -15,12 +17,54 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 import settings as s
-from shared import exponential_backoff
+from shared import exponential_backoff, session
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# non-digit runs stripped from the URL to recover the numeric camera ID
+_NONDIGIT_RE = re.compile(r"\D+")
+
+# delete-table dropping the whitespace that pads the details text
+_STRIP_TABLE = str.maketrans("", "", "\n\t\r")
+
+
+class _ThreadLxml(threading.local):
+    """Per-thread lxml objects, built once per thread since parsers and XPath
+    evaluators reuse internal state and must not be shared across threads."""
+
+    def __init__(self):
+        self.html_parser = HTMLParser()
+        self.xp_img = etree.XPath("//img/@src")
+        # string() concatenates the details text in one traversal
+        self.xp_details_text = etree.XPath('string(//div[@class="camera-details"])')
+
+
+_lxml = _ThreadLxml()
+
+# single-pass pattern over the stripped details string; group names map to the camera info keys
+_DETAILS_RE = re.compile(
+    r"Country:(?P<country>.*?)"
+    r"Country code:(?P<country_code>.*?)"
+    r"Region:(?P<region>.*?)"
+    r"City:(?P<city>.*?)"
+    r"Latitude:"
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fetch_url(url: str, request_headers: Tuple[Tuple[str, str], ...]) -> bytes:
+    """Fetches a URL and memoizes the response body, so revisited URLs skip the HTTP round-trip.
+
+    Fetch errors propagate to the caller; lru_cache does not store calls that
+    raise, so a transient failure never poisons the cache for a URL.
+    """
+    r = session.get(url, headers=dict(request_headers), timeout=s.REQUEST_TIMEOUT)
+    r.raise_for_status()
+    return r.content
+
+
 class Camera:
     """Camera class to handle camera-related operations."""
 
@@ -32,32 +76,41 @@ class Camera:
         """
         self.url = url
         self.id = self._get_camera_id()
+        self.fetch_failed = False
         self.page_content = self._get_camera_page(s.REQUEST_HEADERS)
-        self.page_tree = fromstring(self.page_content) if self.page_content else None
+        self.page_tree = fromstring(self.page_content, parser=_lxml.html_parser) if self.page_content else None
         self.stream_url = self._find_camera_url() if self.page_tree is not None else None
-        self.details = self._get_camera_details() if self.page_tree is not None else None
-        self.info = self._parse_camera_details() if self.details is not None else None
         self.browser = browser
 
+    @functools.cached_property
+    def details(self) -> Optional[str]:
+        """Camera details text, extracted lazily so rejected candidates never pay for it."""
+        return self._get_camera_details() if self.page_tree is not None else None
+
+    @functools.cached_property
+    def info(self) -> Optional[Dict[str, str]]:
+        """Parsed camera info dictionary, materialized on first access."""
+        return self._parse_camera_details() if self.details is not None else None
+
     def _get_camera_id(self) -> str:
         """Extracts the camera ID from the URL."""
-        return "".join(char for char in self.url if char.isdigit())
+        return _NONDIGIT_RE.sub("", self.url)
 
     def _get_camera_page(self, request_headers: Dict[str, str]) -> Optional[bytes]:
-        """Fetches the camera page content."""
+        """Fetches the camera page content, memoized per URL; failures are flagged but never cached."""
         try:
-            r = requests.get(self.url, headers=request_headers)
-            return r.content
-        except (RequestException, OSError):
-            logger.error("error fetching camera page: {e}")
+            return _fetch_url(self.url, tuple(sorted(request_headers.items())))
+        except (RequestException, OSError) as e:
+            logger.error(f"error fetching camera page: {e}")
+            self.fetch_failed = True
             return None
 
     def _find_camera_url(self) -> Optional[str]:
         """Finds the camera stream URL."""
         if self.page_tree is not None:
-            elems = self.page_tree.xpath("//img/@src")
-        if len(elems) > 0:
-            return elems[0]
+            elems = _lxml.xp_img(self.page_tree)
+            if len(elems) > 0:
+                return elems[0]
         return None
 
     def _url_is_valid(self) -> bool:
@@ -68,31 +121,24 @@ class Camera:
 
     def _get_camera_details(self) -> Optional[str]:
         """Extracts the camera details, including city, region, country, and country code."""
-        camera_details_elements = self.page_tree.xpath('//div[@class="camera-details"]')
-        camera_details_content = tuple(element.text_content() for element in camera_details_elements)
-        camera_details = "".join(
-            content.replace("\n", "").replace("\t", "").strip() for content in camera_details_content
-        )
+        camera_details = _lxml.xp_details_text(self.page_tree).translate(_STRIP_TABLE).strip()
         return camera_details if camera_details else None
 
     def _parse_camera_details(self) -> Optional[Dict[str, str]]:
         """Parses the camera details and returns the camera info as a dictionary."""
-        details = self.details
-        camera_info = {}
-
-        if details is not None:
-            keys = [
-                ("City", "Latitude"),
-                ("Region", "City"),
-                ("Country", "Country code"),
-                ("Country code", "Region"),
-            ]
-            for key, next_key in keys:
-                start = details.find(f"{key}:") + len(f"{key}:")
-                end = details.find(f"{next_key}:")
-                value = details[start:end].strip()
-                camera_info[key] = value
-        return camera_info
+        if self.details is None:
+            return None
+
+        match = _DETAILS_RE.search(self.details)
+        if match is None:
+            return None
+
+        return {
+            "City": match.group("city").strip(),
+            "Region": match.group("region").strip(),
+            "Country": match.group("country").strip(),
+            "Country code": match.group("country_code").strip(),
+        }
 
     @exponential_backoff(
         attempts=s.CAMERA_FETCH_ATTEMPTS,
@@ -147,11 +193,17 @@ class Camera:
 
     def _image_is_solid_color(self, image_file_path: str) -> bool:
         """Checks if the image consists of a single color."""
-        image = cv2.imread(image_file_path)
-        if image is None:
+        reduced = cv2.imread(image_file_path, cv2.IMREAD_REDUCED_COLOR_8)
+        if reduced is None:
             logging.error(f"image is empty: {image_file_path}. skipping...")
             return True
 
+        # any pixel variation at 1/8 scale rules out a solid color with ~64x less pixel data
+        if reduced.max() != reduced.min():
+            return False
+
+        # the reduced decode drops pixels, so confirm at full resolution before discarding the image
+        image = cv2.imread(image_file_path)
         standard_deviation = std(image)
         if standard_deviation == 0:
             logging.info("image consists of a single color. skipping...")
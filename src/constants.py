@@ -1,67 +1,84 @@
-import os
-from typing import Dict
-
-import dotenv
-
-dotenv.load_dotenv("prod.env")
-
-# twitter API credentials from environment variables
-CONSUMER_KEY: str = os.getenv("CONSUMER_KEY", "")
-CONSUMER_SECRET: str = os.getenv("CONSUMER_SECRET", "")
-ACCESS_TOKEN: str = os.getenv("ACCESS_TOKEN", "")
-ACCESS_TOKEN_SECRET: str = os.getenv("ACCESS_TOKEN_SECRET", "")
-BEARER_TOKEN: str = os.getenv("BEARER_TOKEN", "")
-
-# template for the image file path with placeholders for variables
-IMG_FILE_PATH_TEMPLATE: str = "{0}{1}_{2}.png"
-
-# the root directory where images will be stored
-IMG_ROOT: str = "../images/"
-
-# regional indicator symbols used to construct the flag emoji at the end of a tweet
-REGIONAL_INDICATOR_SYMBOLS: Dict[str, str] = {
-    "A": "🇦",
-    "B": "🇧",
-    "C": "🇨",
-    "D": "🇩",
-    "E": "🇪",
-    "F": "🇫",
-    "G": "🇬",
-    "H": "🇭",
-    "I": "🇮",
-    "J": "🇯",
-    "K": "🇰",
-    "L": "🇱",
-    "M": "🇲",
-    "N": "🇳",
-    "O": "🇴",
-    "P": "🇵",
-    "Q": "🇶",
-    "R": "🇷",
-    "S": "🇸",
-    "T": "🇹",
-    "U": "🇺",
-    "V": "🇻",
-    "W": "🇼",
-    "X": "🇽",
-    "Y": "🇾",
-    "Z": "🇿",
-}
-
-# dictionary of mappings to shorten country names
-COUNTRY_REPLACEMENTS: Dict[str, str] = {
-    ", Province Of": "",
-    ", Republic Of": "",
-    ", Islamic Republic": "",
-    "n Federation": "",
-    "ian, State Of": "e",
-}
-
-# duration in seconds to wait before posting another tweet
-SLEEP_DURATION: int = 60 * 60
-
-# the URL of the sitemap for the insecam website
-SITEMAP_URL: str = "http://www.insecam.org/static/sitemap.xml"
-
-# the base URL for twitter
-TWITTER_BASE_URL: str = "https://twitter.com"
+import functools
+import os
+from typing import Dict, Final
+
+import dotenv
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Loads the .env file exactly once per process, even if called again."""
+    dotenv.load_dotenv("prod.env")
+
+
+_load_env()
+
+# twitter API credentials from environment variables
+CONSUMER_KEY: Final[str] = os.getenv("CONSUMER_KEY", "")
+CONSUMER_SECRET: Final[str] = os.getenv("CONSUMER_SECRET", "")
+ACCESS_TOKEN: Final[str] = os.getenv("ACCESS_TOKEN", "")
+ACCESS_TOKEN_SECRET: Final[str] = os.getenv("ACCESS_TOKEN_SECRET", "")
+BEARER_TOKEN: Final[str] = os.getenv("BEARER_TOKEN", "")
+
+# template for the image file path with placeholders for variables
+IMG_FILE_PATH_TEMPLATE: Final[str] = "{0}{1}_{2}.png"
+
+# the root directory where images will be stored
+IMG_ROOT: Final[str] = "../images/"
+
+# regional indicator symbols used to construct the flag emoji at the end of a tweet
+REGIONAL_INDICATOR_SYMBOLS: Final[Dict[str, str]] = {
+    "A": "🇦",
+    "B": "🇧",
+    "C": "🇨",
+    "D": "🇩",
+    "E": "🇪",
+    "F": "🇫",
+    "G": "🇬",
+    "H": "🇭",
+    "I": "🇮",
+    "J": "🇯",
+    "K": "🇰",
+    "L": "🇱",
+    "M": "🇲",
+    "N": "🇳",
+    "O": "🇴",
+    "P": "🇵",
+    "Q": "🇶",
+    "R": "🇷",
+    "S": "🇸",
+    "T": "🇹",
+    "U": "🇺",
+    "V": "🇻",
+    "W": "🇼",
+    "X": "🇽",
+    "Y": "🇾",
+    "Z": "🇿",
+}
+
+# dictionary of mappings to shorten country names
+COUNTRY_REPLACEMENTS: Final[Dict[str, str]] = {
+    ", Province Of": "",
+    ", Republic Of": "",
+    ", Islamic Republic": "",
+    "n Federation": "",
+    "ian, State Of": "e",
+}
+
+# duration in seconds to wait before posting another tweet
+SLEEP_DURATION: Final[int] = 60 * 60
+
+# seconds before the end of the sleep window to start validating the next camera
+PREFETCH_LEAD_TIME: Final[int] = 5 * 60
+
+# the URL of the sitemap for the insecam website
+SITEMAP_URL: Final[str] = "http://www.insecam.org/static/sitemap.xml"
+
+# template to rebuild a camera page URL from its numeric ID
+CAMERA_URL_TEMPLATE: Final[str] = "http://www.insecam.org/en/view/{0}/"
+
+# file used to cache the sitemap camera links between runs
+CAMERA_CACHE_FILE: Final[str] = "cameras.cache.json"
+
+# the base URL for twitter
+TWITTER_BASE_URL: Final[str] = "https://twitter.com"
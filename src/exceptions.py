@@ -1,8 +1,8 @@
 class FetchCamerasException(Exception):
     """Custom exception class for handling errors when fetching camera links."""
 
-    def __init__(self, message: str):
+    def __init__(self, message: str = "failed to fetch camera links"):
         self.message = message
 
     def __str__(self) -> str:
-        return repr(self.message)
+        return self.message
@@ -1,5 +1,6 @@
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import constants as c
 from browser import initialize_browser
@@ -16,6 +17,9 @@ from utils import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# single worker that validates the next camera while the bot sleeps between tweets
+_prefetch_pool = ThreadPoolExecutor(max_workers=1)
+
 
 def main() -> None:
     """
@@ -27,10 +31,16 @@ def main() -> None:
     twitter_api = authenticate_twitter()
     available_cameras = load_cameras()
 
+    next_camera_future = None
+
     while True:
-        camera = get_random_valid_camera(
-            available_cameras=available_cameras, camera_constructor=Camera, browser=browser
-        )
+        if next_camera_future is not None:
+            camera = next_camera_future.result()
+            next_camera_future = None
+        else:
+            camera = get_random_valid_camera(
+                available_cameras=available_cameras, camera_constructor=Camera, browser=browser
+            )
 
         image_file_path = c.IMG_FILE_PATH_TEMPLATE.format(c.IMG_ROOT, camera.id, int(time.time()))
 
@@ -51,7 +61,16 @@ def main() -> None:
 
         if tweet_posted_successfully:
             logger.info("waiting for an hour...")
-            time.sleep(c.SLEEP_DURATION)
+            # sleep most of the window first, then validate the next camera near its
+            # end so the upcoming post is both instant and freshly checked
+            time.sleep(c.SLEEP_DURATION - c.PREFETCH_LEAD_TIME)
+            next_camera_future = _prefetch_pool.submit(
+                get_random_valid_camera,
+                available_cameras=available_cameras,
+                camera_constructor=Camera,
+                browser=browser,
+            )
+            time.sleep(c.PREFETCH_LEAD_TIME)
         else:
             continue
 
@@ -3,9 +3,18 @@ import time
 from functools import wraps
 from typing import Callable, Tuple, Type
 
+import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# shared session so every request to insecam reuses pooled keep-alive connections
+# instead of paying a fresh TCP handshake per call
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
 
 def exponential_backoff(
     attempts: int,
@@ -1,8 +1,14 @@
+import functools
+import json
 import logging
+import os
 import random
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Tuple, Type
 
-import requests  # type: ignore
 import tweepy
 from lxml import etree
 from requests.exceptions import RequestException  # type: ignore
@@ -11,7 +17,7 @@ import constants as c
 import settings as s
 from camera import Camera
 from exceptions import FetchCamerasException
-from shared import exponential_backoff
+from shared import exponential_backoff, session
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,32 +41,75 @@ def authenticate_twitter() -> Tuple[tweepy.API, tweepy.Client]:
     return api, client
 
 
+def _load_cached_cameras() -> Optional[list[str]]:
+    """Returns the camera IDs cached on disk, or None if the cache is missing or stale."""
+    try:
+        if time.time() - os.path.getmtime(c.CAMERA_CACHE_FILE) < c.SLEEP_DURATION:
+            with open(c.CAMERA_CACHE_FILE) as cache_file:
+                return [sys.intern(camera_id) for camera_id in json.load(cache_file) if camera_id.isdigit()]
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _save_cached_cameras(camera_ids: list[str]) -> None:
+    """Writes the camera IDs to the on-disk cache."""
+    try:
+        with open(c.CAMERA_CACHE_FILE, "w") as cache_file:
+            json.dump(camera_ids, cache_file)
+    except OSError as e:
+        logger.error(f"failed to write camera cache: {e}")
+
+
 @exponential_backoff(
     attempts=s.CAMERA_FETCH_ATTEMPTS,
     initial_delay=s.INITIAL_RETRY_DELAY,
     factor=s.RETRY_DELAY_FACTOR,
     exception_types=(FetchCamerasException, RequestException),
 )
-def load_cameras() -> Tuple[str, ...]:
-    """Fetches the camera links and returns them as a tuple."""
-    try:
-        r = requests.get(c.SITEMAP_URL)
-        r.raise_for_status()
+def load_cameras() -> list[str]:
+    """Fetches the camera IDs and returns them as a mutable list, preferring the on-disk cache when fresh."""
+    cached_ids = _load_cached_cameras()
+    if cached_ids:
+        logger.info(f"loaded {len(cached_ids)} camera IDs from cache.")
+        return cached_ids
 
-        loc_elements = tuple(link for link in etree.fromstring(r.content).iter("{*}loc"))
-        camera_links = tuple(link.text for link in loc_elements)
-
-        logger.info(f"fetched {len(camera_links)} camera links.")
-        return camera_links
+    try:
+        with session.get(c.SITEMAP_URL, timeout=s.REQUEST_TIMEOUT, stream=True) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True
+
+            # keep only the interned numeric ID; the shared URL prefix is rebuilt on demand
+            ids = []
+            for _, element in etree.iterparse(r.raw, tag="{*}loc"):
+                camera_id = element.text.rsplit("/", 2)[-2]
+                if camera_id.isdigit():
+                    ids.append(sys.intern(camera_id))
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+        logger.info(f"fetched {len(ids)} camera IDs.")
+        _save_cached_cameras(ids)
+        return ids
     except RequestException as e:
         logger.error(f"{type(e).__name__} occurred: {e}")
         raise FetchCamerasException
 
 
+# number of camera candidates fetched concurrently per validation round
+_CANDIDATE_BATCH_SIZE = 8
+
+# thread pool for fetching candidate camera pages; page fetches are I/O-bound, so threads overlap cleanly
+_candidate_pool = ThreadPoolExecutor(max_workers=_CANDIDATE_BATCH_SIZE)
+
+
 def get_random_valid_camera(available_cameras: list[str], camera_constructor: Type[Camera], browser) -> Camera:
     """Returns a random valid Camera object."""
 
     def camera_is_valid(camera: Camera) -> Tuple[bool, Optional[str]]:
+        if camera.fetch_failed:
+            return False, "page fetch failed"
         if not camera.page_content:
             return False, "missing page content"
         if not camera.stream_url:
@@ -73,36 +122,85 @@ def get_random_valid_camera(available_cameras: list[str], camera_constructor: Ty
                 return False, f"located in {banned_country}"
         return True, None
 
+    retry_delay = s.INITIAL_RETRY_DELAY
+
     while True:
-        random_camera_url = random.choice(available_cameras)
-        camera = camera_constructor(random_camera_url, browser)
+        if not available_cameras:
+            raise FetchCamerasException("camera pool exhausted")
+
+        batch_size = min(_CANDIDATE_BATCH_SIZE, len(available_cameras))
+        candidate_indices = random.sample(range(len(available_cameras)), batch_size)
+
+        futures = {
+            _candidate_pool.submit(
+                camera_constructor, c.CAMERA_URL_TEMPLATE.format(available_cameras[index]), browser
+            ): index
+            for index in candidate_indices
+        }
+
+        accepted: Optional[Camera] = None
+        rejected_indices: list[int] = []
+
+        for future in as_completed(futures):
+            camera = future.result()
+            is_valid, reason = camera_is_valid(camera)
+
+            if is_valid:
+                for pending in futures:
+                    pending.cancel()
+                accepted = camera
+                break
+            else:
+                # fetch failures are transient, so only genuinely invalid cameras leave the pool
+                if not camera.fetch_failed:
+                    rejected_indices.append(futures[future])
+                logger.info(f"camera rejected: {camera.id}: {reason}")
+
+        # swap-pop rejected candidates out of the pool, highest index first so
+        # earlier removals never disturb the positions still waiting to be removed
+        for index in sorted(rejected_indices, reverse=True):
+            available_cameras[index] = available_cameras[-1]
+            available_cameras.pop()
+
+        # persist the surviving pool so rejections are remembered across restarts
+        if rejected_indices:
+            _save_cached_cameras(available_cameras)
+
+        if accepted is not None:
+            logger.info(f"camera accepted: {accepted.id}")
+            print(f"attempting to load camera: {accepted.stream_url}")
+            return accepted
+
+        # a round where every candidate failed to fetch points at an outage rather
+        # than bad cameras; back off before sampling again instead of hammering the host
+        if not rejected_indices:
+            logger.info(f"all candidates failed to fetch; retrying in {retry_delay} seconds...")
+            time.sleep(retry_delay)
+            retry_delay *= s.RETRY_DELAY_FACTOR
+        else:
+            retry_delay = s.INITIAL_RETRY_DELAY
 
-        is_valid, reason = camera_is_valid(camera)
 
-        if is_valid:
-            logger.info(f"camera accepted: {camera.id}")
-            print(f"attempting to load camera: {camera.stream_url}")
-            return camera
-        else:
-            logger.info(f"camera rejected: {camera.id}: {reason}")
+# alternation regex applying every country replacement in a single pass
+_COUNTRY_RE = re.compile("|".join(re.escape(old) for old in c.COUNTRY_REPLACEMENTS))
 
 
-def replace_substrings(string: str, mappings: dict[str, str]) -> str:
-    """Replaces substrings in a string based on a dictionary of mappings."""
-    for old, new in mappings.items():
-        string = string.replace(old, new)
-    return string
+@functools.lru_cache(maxsize=512)
+def _normalize_country(country: str) -> str:
+    """Returns the shortened display name for a country, computed once per distinct value."""
+    if country == "-":
+        return "Unknown"
+    return _COUNTRY_RE.sub(lambda match: c.COUNTRY_REPLACEMENTS[match.group(0)], country)
 
 
 def create_tweet_text(camera_info: dict[str, str], flag: str) -> str:
     """Generates a tweet text based on the camera information and flag."""
-    city = camera_info["City"] if camera_info["City"] != "-" else "Unknown"
-    region = camera_info["Region"] if camera_info["Region"] != "-" else "Unknown"
-    country = (
-        replace_substrings(camera_info["Country"], c.COUNTRY_REPLACEMENTS)
-        if camera_info["Country"] != "-"
-        else "Unknown"
-    )
+    # read each field once; the branches below only touch locals
+    raw_city = camera_info["City"]
+    raw_region = camera_info["Region"]
+    city = raw_city if raw_city != "-" else "Unknown"
+    region = raw_region if raw_region != "-" else "Unknown"
+    country = _normalize_country(camera_info["Country"])
 
     # location format adjusted for US and Canada; generalized for other countries
     if country == "United States":
@@ -121,12 +219,17 @@ def create_tweet_text(camera_info: dict[str, str], flag: str) -> str:
         return f"{location} {flag}"
 
 
+# translation table mapping ASCII letters to regional indicator symbols
+_FLAG_TABLE = str.maketrans(c.REGIONAL_INDICATOR_SYMBOLS)
+
+
+@functools.lru_cache(maxsize=512)
 def assemble_flag_emoji(country_code: str) -> str:
     """Converts a country code into a flag emoji."""
-    return "".join(c.REGIONAL_INDICATOR_SYMBOLS.get(char, char) for char in country_code)
+    return country_code.upper().translate(_FLAG_TABLE)
 
 
-def post_to_twitter(twitter_api: tweepy.API, tweet_status: str, image_file_path: str) -> bool:
+def post_to_twitter(twitter_api: Tuple[tweepy.API, tweepy.Client], tweet_status: str, image_file_path: str) -> bool:
     """
     Posts a tweet with the camera image to Twitter.
     Returns True if the post is successful, False otherwise.
@@ -134,7 +237,7 @@ def post_to_twitter(twitter_api: tweepy.API, tweet_status: str, image_file_path:
     try:
         logger.info("posting to twitter...")
 
-        api, client = authenticate_twitter()
+        api, client = twitter_api
         media_info = api.media_upload(filename=image_file_path)
         posted_status_v2 = client.create_tweet(text=tweet_status, media_ids=[media_info.media_id])
 